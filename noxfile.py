@@ -1,69 +1,134 @@
 """NOX config."""
 
 import glob
-import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
 
 import nox
 
 nox.options.sessions = ["lint", "test", "coverage", "build"]
+nox.options.default_venv_backend = "uv|virtualenv"
 
 src_dir = "redictum"
-pkg_meta_src = f"{src_dir}/pkg_meta.py"
-
-
-pkg_meta_spec = importlib.util.spec_from_file_location(
-    "pkg_meta",
-    pkg_meta_src,
-)
-pkg_meta = importlib.util.module_from_spec(pkg_meta_spec)
-pkg_meta_spec.loader.exec_module(pkg_meta)
 
+sys.path.insert(0, src_dir)
+import pkg_meta
 
 default_pyvsn = "3"
-test_pyvsns = ["3.6", "3.7", "3.8", "3.9", "3.10"]
+test_pyvsns = ["3.8", "3.9", "3.10", "3.11"]
 lintable_src = (src_dir, "test", "setup.py", "noxfile.py")
 black_args = ("--line-length", "120", *lintable_src)
 isort_args = ("--profile", "black", src_dir, *lintable_src)
-coverage_args = ("run", "--branch", "--source=" + src_dir, "--omit=" + pkg_meta_src, "-m", "pytest", "test")
+coverage_args = (
+    "--cov=" + src_dir,
+    "--cov-branch",
+    "--cov-report=term",
+    "--cov-report=html",
+    "--cov-report=xml",
+    "-n",
+    "auto",
+    "test",
+)
 
 dev_deps = (*pkg_meta.install_requires, *pkg_meta.extras_require["dev"])
 
 
-@nox.session(python=[default_pyvsn])
+def cached_install(session, *args, ttl=3600):
+    """
+    Install packages into the session virtualenv, unless the exact same install was done recently.
+
+    Installs are recorded in a ".nox_install_cache" JSON file in the virtualenv, keyed by the
+    install args, with the time of install as the value. If the same args were installed less
+    than `ttl` seconds ago, pip is not invoked. Use with `nox -r` so the virtualenv is reused.
+
+    Sessions without a virtualenv (e.g. `nox --no-venv`) have nowhere to keep the cache, so
+    always install.
+    """
+
+    venv_location = getattr(session.virtualenv, "location", None)
+    if venv_location is None:
+        session.install(*args)
+        return
+
+    cache_path = Path(venv_location) / ".nox_install_cache"
+    cache_key = json.dumps(args)
+
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    if time.time() - cache.get(cache_key, 0) < ttl:
+        session.log("Skipping install, cached")
+        return
+
+    session.install(*args)
+
+    cache[cache_key] = time.time()
+    cache_path.write_text(json.dumps(cache))
+
+
+@nox.session(python=[default_pyvsn], reuse_venv=True)
 def lint(session):
-    session.install(*dev_deps)
+    cached_install(session, "pre-commit", *dev_deps)
 
-    session.run("black", "--check", *black_args)
-    session.run("isort", "--check", *isort_args)
+    session.run("pre-commit", "run", "--all-files", "--show-diff-on-failure")
 
 
 @nox.session(python=test_pyvsns)
 def test(session):
-    session.install(*dev_deps)
+    cached_install(session, *dev_deps)
+
+    session.run("pytest", *(session.posargs or ("-n", "auto")))
+
+
+@nox.session(python=False)
+def test_parallel(session):
+    pytest_args = session.posargs or ("-n", str(max(1, (os.cpu_count() or 1) // len(test_pyvsns))))
+    procs = {
+        pyvsn: subprocess.Popen(
+            [sys.executable, "-m", "nox", "-s", f"test-{pyvsn}", "--", *pytest_args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        for pyvsn in test_pyvsns
+    }
+
+    failed = []
+    for pyvsn, proc in procs.items():
+        output, _ = proc.communicate()
+        session.log(f"Output for python {pyvsn}:")
+        print(output, end="", flush=True)
+
+        if proc.returncode != 0:
+            failed.append(pyvsn)
 
-    session.run("pytest")
+    if failed:
+        session.error(f"Tests failed for python {', '.join(failed)}")
 
 
-@nox.session(python=[default_pyvsn])
+@nox.session(python=[default_pyvsn], reuse_venv=True)
 def coverage(session):
-    session.install(*dev_deps)
+    cached_install(session, *dev_deps)
 
-    session.run("coverage", *coverage_args)
-    session.run("coverage", "report")
-    session.run("coverage", "html")
-    session.run("coverage", "xml")
+    session.run("pytest", *coverage_args)
 
 
-@nox.session(python=[default_pyvsn])
+@nox.session(python=[default_pyvsn], reuse_venv=True)
 def build(session):
-    session.install("setuptools", "wheel")
+    cached_install(session, "build")
 
-    session.run("python3", "setup.py", "sdist", "bdist_wheel")
+    session.run("python", "-m", "build", "--sdist", "--wheel")
 
 
-@nox.session(python=[default_pyvsn])
+@nox.session(python=[default_pyvsn], reuse_venv=True)
 def format(session):
-    session.install(*dev_deps)
+    cached_install(session, *dev_deps)
 
     session.run("black", *black_args)
     session.run("isort", *isort_args)
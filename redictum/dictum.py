@@ -3,7 +3,7 @@
 
 import hashlib
 import inspect
-from datetime import datetime
+from time import time
 
 import bencodepy
 
@@ -137,7 +137,7 @@ class Dictum(metaclass=DictumRegister):
 
     def _set_meta_data(self, meta_data=None, ts=None):
         if meta_data is None:
-            now_ts = ts if ts is not None else datetime.now().timestamp()
+            now_ts = ts if ts is not None else time()
 
             meta_data = {
                 "valid_from_ts": now_ts,
@@ -20,7 +20,7 @@ entry_points = {
     "console_scripts": [],
 }
 
-python_requires = ">=3.6"
+python_requires = ">=3.8"
 install_requires = [
     "singleton-type==0.0.4",
     "sqlalchemy==1.4.37",
@@ -30,10 +30,11 @@ install_requires = [
 extras_require = {
     "dev": [
         "pytest==7.0.1",
+        "pytest-xdist==2.5.0",
+        "pytest-cov==3.0.0",
         "coverage==6.2",
         "black==22.3.0",
         "isort==5.10.1",
-        "freezegun==1.2.1",
     ],
 }
 
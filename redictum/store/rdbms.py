@@ -83,11 +83,39 @@ class RdbmsStore(StoreBase, metaclass=Singleton):
     def commit(self, dictum):
         """Commit new dictum to the store, or update it if it already exists."""
 
+        self.bulk_commit([dictum])
+
+    def bulk_commit(self, dictums):
+        """Commit new dictums to the store, or update them if they already exist, in a single transaction."""
+
+        dictums = list(dictums)
+
         session = self._create_session()
+
+        try:
+            staged = [self._stage_commit(session, dictum) for dictum in dictums]
+
+            session.flush()
+            session.commit()
+
+            for dictum, (record, _same_dictum) in zip(dictums, staged):
+                dictum.link_store(record.id, self, record)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._close_session(session)
+
+        for dictum, (_record, same_dictum) in zip(dictums, staged):
+            if same_dictum is None:
+                dictum.added()
+            else:
+                dictum.updated(same_dictum)
+
+    def _stage_commit(self, session, dictum):
         same_dictum = self._load_by_udigest(session, dictum.udigest)
-        new_dictum = same_dictum is None
 
-        if new_dictum:
+        if same_dictum is None:
             record = self.DictumTable(
                 **dictum.meta_data,
                 code=self.dictum_cls_to_code(type(dictum)),
@@ -104,17 +132,7 @@ class RdbmsStore(StoreBase, metaclass=Singleton):
             record.valid_to_ts = dictum.meta_data["valid_to_ts"]
             record.data = json.dumps(dictum.data)
 
-        session.flush()
-        session.commit()
-
-        dictum.link_store(record.id, self, record)
-
-        self._close_session(session)
-
-        if new_dictum:
-            dictum.added()
-        else:
-            dictum.updated(same_dictum)
+        return record, same_dictum
 
     def delete(self, dictum):
         """Delete dictum from the store."""
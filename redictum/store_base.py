@@ -46,6 +46,17 @@ class StoreBase:
 
         raise self.UnimplementedError()  # pragma: no cover
 
+    def bulk_commit(self, dictums):
+        """
+        Commit (create or update) each of the given dictums to permanent storage, or raise if unsuccessful.
+
+        Subclass may implement, if the back end storage can do this more efficiently than committing the
+        dictums one at a time, which is what the default implementation does.
+        """
+
+        for dictum in dictums:
+            self.commit(dictum)
+
     def delete(self, dictum):
         """
         Delete the dictum from permanent storage, or raise if unsuccessful.
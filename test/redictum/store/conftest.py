@@ -0,0 +1,21 @@
+"""Shared fixtures and configuration for the storage adapter tests."""
+
+
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_test_pragmas(dbapi_connection, _connection_record):
+    """Turn off SQLite durability for test databases, there is nothing to preserve."""
+
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
@@ -2,13 +2,13 @@
 Test cases for the rdbms storage adapter.
 
 In principal these test cases should be adaptable to any storage adapter with minimal change
-by replacing the `existing_store` fixture, and changing the class in `test_constructor_returns_store`.
+by replacing the `existing_store` and `populated_store` fixtures, and changing the class in
+`test_constructor_returns_store`.
 The singleton tests `test_constructor_is_singleton` and `test_constructor_diff_objs_per_dsn` may
 or may not be applicable to other adapters.
 """
 
 
-import re
 from datetime import datetime
 
 import pytest
@@ -18,12 +18,40 @@ from redictum import Dictum
 from redictum.store import RdbmsStore
 
 
-@pytest.fixture
+def clear_store(store):
+    for c in store.load_all():
+        store.delete(c)
+
+
+@pytest.fixture(scope="module")
 def existing_store():
     store = RdbmsStore("sqlite:///:memory:")
+    clear_store(store)
 
-    for c in store.load_all():
-        store.delete(c)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def cleared_existing_store(existing_store):
+    yield
+
+    clear_store(existing_store)
+
+
+@pytest.fixture(scope="module")
+def populated_store(new_dictums_6list):
+    store = RdbmsStore("sqlite:///:memory:?populated=1")
+    clear_store(store)
+
+    store.bulk_commit(new_dictums_6list)
+
+    return store
+
+
+@pytest.fixture(scope="module")
+def single_session_store():
+    store = RdbmsStore("sqlite:///:memory:?single_session=1", single_session=True)
+    clear_store(store)
 
     return store
 
@@ -36,7 +64,7 @@ def new_dictum():
     return TestDictum({})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def new_dictums_6list():
     class TestDictum(Dictum):
         ttl = 2000
@@ -110,8 +138,8 @@ def test_load_by_id_loads_applied_dictum(existing_store, new_dictum):
     assert new_dictum == dictum
 
 
-def test_load_by_id_loads_applied_dictum(existing_store):
-    """Check load_by_id None if ID does not exist."""
+def test_load_by_id_returns_none_if_missing(existing_store):
+    """Check load_by_id returns None if ID does not exist."""
 
     assert existing_store.load_by_id(1234567890) is None
 
@@ -126,74 +154,27 @@ def test_load_by_udigest_loads_dictum(existing_store, new_dictum):
     assert new_dictum == dictum
 
 
-def test_load_valid_loads_dictums_currently_valid(existing_store, new_dictums_6list):
-    """Check valid_dictums returns dictums which "valid" (between "from" and "to") of the current time."""
-
-    for new_dictum in new_dictums_6list:
-        existing_store.commit(new_dictum)
-
-    valid_dictums = existing_store.load_valid()
-
-    assert all([dictum.data["is"] == "present" for dictum in valid_dictums])
-    assert set([c.data["order"] for c in valid_dictums]) == {3, 4}
-
-
-def test_load_valid_loads_dictums_valid_at_ts(existing_store, new_dictums_6list):
-    """Check valid_dictums returns dictums which "valid" (between "from" and "to") for a given timestamp."""
-
-    for new_dictum in new_dictums_6list:
-        existing_store.commit(new_dictum)
-
-    valid_dictums = existing_store.load_valid(datetime.now().timestamp() - 3000)
-
-    assert all([dictum.data["is"] == "past" for dictum in valid_dictums])
-    assert set([c.data["order"] for c in valid_dictums]) == {1, 2}
-
-
-def test_load_expired_loads_dictums_currently_expired(existing_store, new_dictums_6list):
-    """Check load_expired returns dictums which expire before the current time."""
-
-    for new_dictum in new_dictums_6list:
-        existing_store.commit(new_dictum)
-
-    expired_dictums = existing_store.load_expired()
-
-    assert all([dictum.data["is"] == "past" for dictum in expired_dictums])
-    assert set([c.data["order"] for c in expired_dictums]) == {1, 2}
-
-
-def test_load_expired_loads_dictums_expired_at_ts(existing_store, new_dictums_6list):
-    """Check load_expired returns dictums which expire before the given timestamp."""
-
-    for new_dictum in new_dictums_6list:
-        existing_store.commit(new_dictum)
-
-    expired_dictums = existing_store.load_expired(datetime.now().timestamp() + 5500)
-
-    assert set([c.data["order"] for c in expired_dictums]) == {1, 2, 3, 4, 5}
-
-
-def test_load_future_loads_dictums_currently_future(existing_store, new_dictums_6list):
-    """Check load_future returns dictums in the future of the current time."""
-
-    for new_dictum in new_dictums_6list:
-        existing_store.commit(new_dictum)
-
-    future_dictums = existing_store.load_future()
-
-    assert all([dictum.data["is"] == "future" for dictum in future_dictums])
-    assert set([c.data["order"] for c in future_dictums]) == {5, 6}
-
-
-def test_load_future_loads_dictums_future_at_ts(existing_store, new_dictums_6list):
-    """Check load_future returns dictums in the future of the given timestamp."""
-
-    for new_dictum in new_dictums_6list:
-        existing_store.commit(new_dictum)
+@pytest.mark.parametrize(
+    "loader_name, ts_offset, expected_orders",
+    [
+        ("load_valid", None, {3, 4}),
+        ("load_valid", -3000, {1, 2}),
+        ("load_expired", None, {1, 2}),
+        ("load_expired", 5500, {1, 2, 3, 4, 5}),
+        ("load_future", None, {5, 6}),
+        ("load_future", 3500, {6}),
+    ],
+)
+def test_load_window(populated_store, loader_name, ts_offset, expected_orders):
+    """
+    Check load_valid, load_expired and load_future return the dictums which are valid, expired or
+    in the future (respectively) for the current time, or for the current time plus `ts_offset`.
+    """
 
-    future_dictums = existing_store.load_future(datetime.now().timestamp() + 3500)
+    loader = getattr(populated_store, loader_name)
+    dictums = loader() if ts_offset is None else loader(datetime.now().timestamp() + ts_offset)
 
-    assert set([c.data["order"] for c in future_dictums]) == {6}
+    assert set([c.data["order"] for c in dictums]) == expected_orders
 
 
 def test_commit_updates_existing_dictum_if_not_unique(existing_store, new_dictums_6overlappinglist):
@@ -231,6 +212,65 @@ def test_commit_updates_existing_dictum_if_not_unique(existing_store, new_dictum
     assert existing_store.load_by_id(new_dictums_6overlappinglist[5].id).data["is"] == "present6"
 
 
+def test_bulk_commit_adds_and_updates_dictums(existing_store, new_dictums_6overlappinglist):
+    """
+    Check bulk_commit commits all the dictums from new_dictums_6overlappinglist, with the overlapping
+    ones (see `test_commit_updates_existing_dictum_if_not_unique`) taken as updates, not new dictums.
+    """
+
+    existing_store.bulk_commit(new_dictums_6overlappinglist)
+
+    assert all([isinstance(dictum.id, int) for dictum in new_dictums_6overlappinglist])
+    assert new_dictums_6overlappinglist[0].id == new_dictums_6overlappinglist[1].id
+    assert new_dictums_6overlappinglist[2].id == new_dictums_6overlappinglist[3].id
+    assert set([c.data["is"] for c in existing_store.load_valid()]) == {"present2", "present4", "present5", "present6"}
+
+
+def test_bulk_commit_calls_added_and_updated_callbacks(existing_store, new_dictums_6overlappinglist):
+    """
+    Check bulk_commit calls `added` for each new dictum and `updated` (with the previous version of the
+    dictum) for each overlapping one, in order, as committing them one at a time would.
+    """
+
+    calls = []
+    for n, dictum in enumerate(new_dictums_6overlappinglist):
+        dictum.added = lambda n=n: calls.append((n, "added", None))
+        dictum.updated = lambda old_dictum, n=n: calls.append((n, "updated", old_dictum.data["is"]))
+
+    existing_store.bulk_commit(new_dictums_6overlappinglist)
+
+    assert calls == [
+        (0, "added", None),
+        (1, "updated", "present1"),
+        (2, "added", None),
+        (3, "updated", "present3"),
+        (4, "added", None),
+        (5, "added", None),
+    ]
+
+
+@pytest.mark.parametrize("store_fixture", ["existing_store", "single_session_store"])
+def test_bulk_commit_persists_nothing_if_a_dictum_fails(request, store_fixture, new_dictum):
+    """Check a failure part way through bulk_commit leaves nothing behind for a later commit to persist."""
+
+    class TestDictum(Dictum):
+        pass
+
+    store = request.getfixturevalue(store_fixture)
+    good_dictum = TestDictum({"a": 1})
+    bad_dictum = TestDictum({"a": b"not JSON serialisable"})
+
+    with pytest.raises(TypeError):
+        store.bulk_commit([good_dictum, bad_dictum])
+
+    assert good_dictum.id is None
+    assert store.load_all() == []
+
+    store.commit(new_dictum)
+
+    assert [dictum.data for dictum in store.load_all()] == [{}]
+
+
 def test_sync_updates_kwargs(existing_store, new_dictum):
     """Check sync updates items in kwargs."""
 
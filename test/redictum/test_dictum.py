@@ -2,10 +2,20 @@ import re
 from datetime import datetime
 
 import pytest
-from freezegun import freeze_time
 
 from redictum import Dictum
 
+repr_re = re.compile(r"redictum\.dictum\.Dictum\{(?:'\w+': .+)+\}")
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    now = datetime(2022, 5, 28)
+
+    monkeypatch.setattr("redictum.dictum.time", now.timestamp)
+
+    return now
+
 
 def test_constructor_returns_dictum():
     """Check constructor returns a dictum object."""
@@ -18,7 +28,7 @@ def test_repr_shows_data():
 
     res = repr(Dictum({"foo": "bar"}))
 
-    assert re.compile(r"redictum\.dictum\.Dictum\{(:?'\w+': .+)+\}").match(res)
+    assert repr_re.match(res)
     assert "'foo': 'bar'" in res
 
 
@@ -27,21 +37,19 @@ def test_str_shows_data():
 
     res = str(Dictum({"foo": "bar"}))
 
-    assert re.compile(r"redictum\.dictum\.Dictum\{(:?'\w+': .+)+\}").match(str(res))
+    assert repr_re.match(res)
     assert "'foo': 'bar'" in res
 
 
-@freeze_time("2022-05-28")
-def test_valid_from_now_by_default():
+def test_valid_from_now_by_default(frozen_now):
     """Check default valid from time is now."""
 
     dictum = Dictum({"foo": "bar"})
 
-    assert dictum.meta_data["valid_from_ts"] == datetime.now().timestamp()
+    assert dictum.meta_data["valid_from_ts"] == frozen_now.timestamp()
 
 
-@freeze_time("2022-05-28")
-def test_valid_to_none_by_default():
+def test_valid_to_none_by_default(frozen_now):
     """Check default valid to time is None."""
 
     dictum = Dictum({"foo": "bar"})
@@ -49,8 +57,7 @@ def test_valid_to_none_by_default():
     assert dictum.meta_data["valid_to_ts"] is None
 
 
-@freeze_time("2022-05-28")
-def test_valid_to_now_plus_ttl_if_ttl():
+def test_valid_to_now_plus_ttl_if_ttl(frozen_now):
     """Check valid to time is now plus the TTL, if there is a TTL."""
 
     class MyDictum(Dictum):
@@ -58,8 +65,8 @@ def test_valid_to_now_plus_ttl_if_ttl():
 
     dictum = MyDictum({"foo": "bar"})
 
-    assert dictum.meta_data["valid_from_ts"] == datetime.now().timestamp()
-    assert dictum.meta_data["valid_to_ts"] == datetime.now().timestamp() + 100
+    assert dictum.meta_data["valid_from_ts"] == frozen_now.timestamp()
+    assert dictum.meta_data["valid_to_ts"] == frozen_now.timestamp() + 100
 
 
 def test_slide_ts_window_moves_from_to_ts_when_ttl():
@@ -0,0 +1,20 @@
+from redictum import Dictum
+from redictum.store_base import StoreBase
+
+
+def test_bulk_commit_commits_each_dictum_in_order():
+    """Check the default bulk_commit calls commit once for each dictum, in order."""
+
+    class RecordingStore(StoreBase):
+        def __init__(self):
+            self.committed = []
+
+        def commit(self, dictum):
+            self.committed.append(dictum)
+
+    store = RecordingStore()
+    dictums = [Dictum({"order": order}) for order in range(3)]
+
+    store.bulk_commit(iter(dictums))
+
+    assert [id(dictum) for dictum in store.committed] == [id(dictum) for dictum in dictums]